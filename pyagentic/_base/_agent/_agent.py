@@ -3,6 +3,7 @@ import inspect
 import json
 import asyncio
 from functools import wraps
+from weakref import WeakKeyDictionary
 from typing import (
     Callable,
     Any,
@@ -52,6 +53,10 @@ from pyagentic.tracing import BasicTracer
 
 logger = get_logger(__name__)
 
+# Linked-agent tool definitions, per agent class and link name. Built once so
+# their specs are cached across inference steps instead of rebuilt each time.
+_linked_tool_defs: WeakKeyDictionary[type, dict[str, _ToolDefinition]] = WeakKeyDictionary()
+
 
 async def _safe_run(fn, *args, **kwargs):
     """
@@ -620,7 +625,9 @@ class BaseAgent(metaclass=AgentMeta):
         compiled_args = None
         try:
             # Compile args converts raw JSON to typed parameters (e.g., dict -> Pydantic models)
-            compiled_args = tool_def.compile_args(**kwargs)
+            compiled_args = tool_def.compile_args(
+                self.provider.__strict_tool_schemas__, **kwargs
+            )
         except ValidationError as e:
             # Handle validation errors for tool arguments
             error = f"Function Args were invalid: {str(e)}"
@@ -1058,7 +1065,8 @@ class BaseAgent(metaclass=AgentMeta):
         When an agent is linked to another agent, it appears as a tool that can be
         called by the LLM. This method generates the tool definition with the agent's
         __description__ as the tool description and the agent's __call__ signature
-        as the tool parameters.
+        as the tool parameters. The definition is built once per class and name and
+        reused, so its tool specs stay cached across steps.
 
         Args:
             name (str): The name to use for this agent when it appears as a tool
@@ -1066,6 +1074,10 @@ class BaseAgent(metaclass=AgentMeta):
         Returns:
             _ToolDefinition: A tool definition that can be sent to the LLM
         """
+        cached = _linked_tool_defs.setdefault(cls, {}).get(name)
+        if cached is not None:
+            return cached
+
         desc = getattr(cls, "__description__", "") or ""
 
         # Create a fresh async wrapper function for this agent class
@@ -1077,4 +1089,5 @@ class BaseAgent(metaclass=AgentMeta):
         # Apply @tool decorator to extract parameter info and create definition
         td = tool(desc)(_invoke).__tool_def__
         td.name = name
+        _linked_tool_defs[cls][name] = td
         return td
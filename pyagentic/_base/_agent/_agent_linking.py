@@ -55,7 +55,7 @@ class Link(Generic[T]):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class _LinkedAgentDefinition:
     """
     Internal definition for linked agent configuration.
@@ -1,5 +1,6 @@
-from typing import Any, Callable, Self, Literal
-from dataclasses import dataclass, field
+from typing import Any, Callable, Self, Literal, get_args, get_origin
+from dataclasses import dataclass, field, fields
+from functools import cache
 
 from pyagentic._base._ref import RefNode
 from pyagentic.policies._policy import Policy
@@ -7,7 +8,28 @@ from pyagentic.policies._policy import Policy
 type MaybeRef[T] = T | RefNode
 
 
-@dataclass
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Returns the dataclass field names of a spec info class, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+@cache
+def _ref_fields(cls: type) -> tuple[tuple[str, Any], ...]:
+    """
+    Returns ``(name, expected type)`` for each field annotated ``MaybeRef[T]``, computed
+        once per class.
+    """
+    ref_fields = []
+    for f in fields(cls):
+        for arg in (f.type, *get_args(f.type)):
+            if get_origin(arg) is MaybeRef:
+                ref_fields.append((f.name, get_args(arg)[0]))
+                break
+    return tuple(ref_fields)
+
+
+@dataclass(slots=True)
 class _SpecInfo:
     default: Any | None = None
     default_factory: Callable | None = None
@@ -21,26 +43,53 @@ class _SpecInfo:
         else:
             return None
 
-    def resolve(self, agent_reference: dict) -> Self:
-        def _resolve_value(value: Any) -> Any:
+    def has_refs(self) -> bool:
+        """
+        Returns whether any field holds a RefNode (directly or inside a list) that needs
+            resolving against an agent reference.
+        """
+        for name in _field_names(self.__class__):
+            value = getattr(self, name)
             if isinstance(value, RefNode):
-                return value.resolve(agent_reference)
-            if isinstance(value, list):
-                # resolve refs nested in list fields, e.g. MCPInfo.args
-                return [_resolve_value(item) for item in value]
-            return value
+                return True
+            if isinstance(value, list) and any(isinstance(item, RefNode) for item in value):
+                return True
+        return False
 
+    def resolve(self, agent_reference: dict) -> Self:
         attrs: dict[str, Any] = {}
+        changed = False
 
-        # walk actual model fields, not the dumped / serialized version
-        for name in self.__dict__:
-            attrs[name] = _resolve_value(getattr(self, name))
+        # walk actual model fields, not the dumped / serialized version, resolving refs in
+        # a single pass over each field and list item
+        for name in _field_names(self.__class__):
+            value = getattr(self, name)
+            if isinstance(value, RefNode):
+                value = value.resolve(agent_reference)
+                changed = True
+            elif isinstance(value, list):
+                # resolve refs nested in list fields, e.g. MCPInfo.args
+                items = []
+                list_changed = False
+                for item in value:
+                    if isinstance(item, RefNode):
+                        item = item.resolve(agent_reference)
+                        list_changed = True
+                    items.append(item)
+                if list_changed:
+                    value = items
+                    changed = True
+            attrs[name] = value
+
+        # Most infos hold no refs; they resolve to themselves without a rebuild
+        if not changed:
+            return self
 
         # rebuild same class with resolved attrs
         return self.__class__(**attrs)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentInfo(_SpecInfo):
     """
     Descriptor for configuring linked agent fields.
@@ -51,7 +100,7 @@ class AgentInfo(_SpecInfo):
     shared: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class StateInfo(_SpecInfo):
     """
     Descriptor for configuring State field metadata and policies.
@@ -61,9 +110,12 @@ class StateInfo(_SpecInfo):
     access: Literal["read", "write", "readwrite", "hidden"] = field(default="read")
     get_description: str | None = None
     set_description: str | None = None
+    # Whether a default was explicitly declared, so an explicit `default=None` can be told
+    # apart from no default at all
+    has_default: bool = field(default=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamInfo(_SpecInfo):
     """
     Declares metadata for parameters in tool declarations and/or Parameter declarations.
@@ -88,7 +140,7 @@ class ParamInfo(_SpecInfo):
     values: MaybeRef[list[str]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPInfo(_SpecInfo):
     """Descriptor for configuring MCP server connections."""
 
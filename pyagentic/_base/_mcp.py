@@ -41,7 +41,7 @@ class MCPLink:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class _MCPDefinition:
     """Pairs an agent field name with its MCP configuration."""
 
@@ -162,10 +162,11 @@ class _MCPToolDefinition(_ToolDefinition):
             "input_schema": schema,
         }
 
-    def compile_args(self, **kwargs) -> dict[str, Any]:
+    def compile_args(self, strict: bool = False, /, **kwargs) -> dict[str, Any]:
         """Pass-through: MCP handles its own validation.
 
         Args:
+            strict (bool): Whether the args came from a strict-mode spec (unused).
             **kwargs: Raw keyword arguments from the LLM tool call.
 
         Returns:
@@ -2,10 +2,9 @@ import copy
 import inspect
 import threading
 import warnings
+import weakref
 from typing import dataclass_transform, TypeVar, Mapping, Type, Any, get_type_hints
 from types import MappingProxyType
-from collections import ChainMap
-from c3linearize import linearize
 from typeguard import check_type, TypeCheckError
 from pydantic import BaseModel, Field, create_model
 
@@ -31,6 +30,47 @@ class Agent:
     pass
 
 
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
+
+# Tool response models keyed by tool definition. Inherited tools share the same
+# _ToolDefinition object, so subclasses reuse the parent's compiled Pydantic model
+_tool_response_cache: "weakref.WeakKeyDictionary[_ToolDefinition, Type[ToolResponse]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _tool_response_model(tool_def: _ToolDefinition) -> Type[ToolResponse]:
+    """Returns the ToolResponse model for a tool definition, building it on first use."""
+    model = _tool_response_cache.get(tool_def)
+    if model is None:
+        model = ToolResponse.from_tool_def(tool_def)
+        _tool_response_cache[tool_def] = model
+    return model
+
+
+# Request model params keyed by __call__ function. Most agents inherit __call__, so its
+# signature and type hints only need to be inspected once
+_call_params_cache: "weakref.WeakKeyDictionary[Any, tuple[tuple[str, Any, Any], ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _call_params(call) -> tuple[tuple[str, Any, Any], ...]:
+    """Returns the (name, annotation, default) of each __call__ param, excluding self."""
+    params = _call_params_cache.get(call)
+    if params is None:
+        sig = inspect.signature(call)
+        hints = get_type_hints(call, include_extras=True)
+        params = tuple(
+            (name, hints.get(name, str), param.default)
+            for name, param in sig.parameters.items()
+            if name != "self"
+        )
+        _call_params_cache[call] = params
+    return params
+
+
 @dataclass_transform(field_specifiers=(_SpecInfo,))
 class AgentMeta(type):
     """
@@ -42,43 +82,27 @@ class AgentMeta(type):
     """
 
     __BaseAgent__ = None
-    _lock = threading.RLock()
+    _lock = threading.Lock()
 
     @staticmethod
-    def _inherited_namespace_from_bases(bases: tuple[type, ...]) -> dict[str, object]:
+    def _inherited_namespace(cls: type) -> dict[str, object]:
         """
-        Builds the inherited (raw) namespace you'd see via MRO lookup for a class with `bases`.
+        Builds the inherited (raw) namespace you'd see via MRO lookup for a newly created class.
         Returns a dict where earlier bases in the MRO win.
 
         Args:
-            bases (tuple[type, ...]): Tuple of base classes
+            cls (type): The class being created; its own namespace is excluded
 
         Returns:
             dict[str, object]: Combined namespace from all bases in MRO order
         """
-        # Build a graph: any hashable node -> list of parents
-        # Use a sentinel NEW for the (not-yet-created) class
-        NEW = object()
-        graph = {NEW: list(bases)}
-
-        # Add all reachable base classes and their parents
-        stack = list(bases)
-        seen = set()
-        while stack:
-            cls = stack.pop()
-            if cls in seen or cls is object:
-                continue
-            seen.add(cls)
-            parents = [b for b in cls.__bases__ if b is not object]
-            graph[cls] = parents
-            stack.extend(parents)
-
-        # Use C3 linearization starting from NEW
-        order = linearize(graph)[NEW]
-        mro_bases = [c for c in order if isinstance(c, type) and c is not object]
-
-        # Chain the raw class dicts in MRO precedence (leftmost wins)
-        return dict(ChainMap(*(vars(c) for c in mro_bases)))
+        # CPython has already C3-linearized the bases into cls.__mro__, so walk that
+        # instead of re-linearizing the base graph
+        namespace: dict[str, object] = {}
+        for base in reversed(cls.__mro__[1:]):
+            if base is not object:
+                namespace.update(vars(base))
+        return namespace
 
     @staticmethod
     def _extract_tool_defs(namespace) -> Mapping[str, _ToolDefinition]:
@@ -96,8 +120,9 @@ class AgentMeta(type):
         """
         tools: dict[str, _ToolDefinition] = {}
         for attr_name, attr_value in namespace.items():
-            if hasattr(attr_value, "__tool_def__"):
-                tools[attr_name] = attr_value.__tool_def__
+            tool_def = getattr(attr_value, "__tool_def__", _MISSING)
+            if tool_def is not _MISSING:
+                tools[attr_name] = tool_def
         return MappingProxyType(tools)
 
     @staticmethod
@@ -115,6 +140,17 @@ class AgentMeta(type):
         Returns:
             dict[str, TypeVar]: Combined annotations from all classes in hierarchy
         """
+        # Fast path: a subclass of a single agent that declares no annotations of its own
+        # (e.g. one that only overrides __instructions__). The base already carries the
+        # combined, filtered annotations for its hierarchy.
+        if (
+            cls is not None
+            and len(bases) == 1
+            and getattr(bases[0], "__abstract_base__", True) is False
+            and not cls.__annotations__
+        ):
+            return dict(bases[0].__annotations__)
+
         annotations = {}
         for base in reversed(bases):
             if hasattr(base, "__annotations__"):
@@ -133,7 +169,9 @@ class AgentMeta(type):
         return annotations
 
     @staticmethod
-    def _extract_state_defs(annotations, namespace) -> Mapping[str, _StateDefinition]:
+    def _extract_state_defs(
+        annotations, namespace, field_kinds=None
+    ) -> Mapping[str, _StateDefinition]:
         """
         Extracts state field definitions from annotations and namespace.
 
@@ -143,6 +181,7 @@ class AgentMeta(type):
         Args:
             annotations (dict): Combined annotations from the class hierarchy
             namespace (dict): The class namespace
+            field_kinds (dict, optional): Records "state" for each field found
 
         Returns:
             Mapping[str, _StateDefinition]: Immutable mapping of state field names to definitions
@@ -151,7 +190,7 @@ class AgentMeta(type):
 
         for attr_name, attr_type in annotations.items():
             # Check if it's a State[T] generic
-            if hasattr(attr_type, "__origin__") and attr_type.__origin__ is State:
+            if getattr(attr_type, "__origin__", None) is State:
                 state_model = attr_type.__state_model__
 
                 # Check if there's a StateInfo descriptor in namespace
@@ -162,6 +201,8 @@ class AgentMeta(type):
                     state_info = StateInfo(default=None)
 
                 state_attributes[attr_name] = _StateDefinition(model=state_model, info=state_info)
+                if field_kinds is not None:
+                    field_kinds[attr_name] = "state"
 
         return MappingProxyType(state_attributes)
 
@@ -173,6 +214,9 @@ class AgentMeta(type):
         Dynamically generate `get_<state>` and `set_<state>` tools
         based on each state's privileges and attach them to the agent class.
         """
+        # Nothing to generate for state-less agents
+        if not state_defs:
+            return MappingProxyType({})
 
         state_tool_defs: dict[str, _ToolDefinition] = {}
 
@@ -238,7 +282,7 @@ class AgentMeta(type):
 
     @staticmethod
     def _extract_linked_agents(
-        annotations, namespace, Agent
+        annotations, namespace, Agent, field_kinds=None
     ) -> Mapping[str, _LinkedAgentDefinition]:
         """
         Extracts linked agent fields from annotations and pairs with AgentInfo.
@@ -250,6 +294,7 @@ class AgentMeta(type):
             annotations (dict): Combined annotations from the class hierarchy
             namespace (dict): The class namespace
             Agent (type): The base Agent class to check against
+            field_kinds (dict, optional): Records "agent" for each field found
 
         Returns:
             Mapping[str, _LinkedAgentDefinition]: Immutable mapping of agent field names to definitions
@@ -260,7 +305,7 @@ class AgentMeta(type):
             agent_class = None
 
             # Check if it's a Link[T] generic (similar to State[T])
-            if hasattr(attr_type, "__origin__") and attr_type.__origin__ is Link:
+            if getattr(attr_type, "__origin__", None) is Link:
                 type_info = analyze_type(attr_type.__linked_agent__, Agent)
                 if type_info.is_subclass:
                     agent_class = attr_type.__linked_agent__
@@ -289,12 +334,14 @@ class AgentMeta(type):
                 linked_agents[attr_name] = _LinkedAgentDefinition(
                     agent=agent_class, info=agent_info
                 )
+                if field_kinds is not None:
+                    field_kinds[attr_name] = "agent"
 
         return MappingProxyType(linked_agents)
 
     @staticmethod
     def _extract_mcp_defs(
-        annotations, namespace
+        annotations, namespace, field_kinds=None
     ) -> Mapping[str, _MCPDefinition]:
         """Extracts MCP server definitions from annotations and namespace.
 
@@ -304,6 +351,7 @@ class AgentMeta(type):
         Args:
             annotations (dict): Combined annotations from the class hierarchy.
             namespace (dict): The class namespace.
+            field_kinds (dict, optional): Records ``"mcp"`` for each field found.
 
         Returns:
             Mapping[str, _MCPDefinition]: Immutable mapping of field names to
@@ -322,11 +370,13 @@ class AgentMeta(type):
                 mcp_defs[attr_name] = _MCPDefinition(
                     field_name=attr_name, info=mcp_info
                 )
+                if field_kinds is not None:
+                    field_kinds[attr_name] = "mcp"
 
         return MappingProxyType(mcp_defs)
 
     @staticmethod
-    def _extract_dependencies(annotations, namespace) -> Mapping[str, type]:
+    def _extract_dependencies(annotations, namespace, field_kinds=None) -> Mapping[str, type]:
         """Extracts dependency-injected fields declared with ``Depends[T]``.
 
         Looks for annotations whose marker has ``__origin__ is Depends`` and
@@ -337,6 +387,7 @@ class AgentMeta(type):
         Args:
             annotations (dict): Combined annotations from the class hierarchy.
             namespace (dict): The class namespace.
+            field_kinds (dict, optional): Records ``"dependency"`` for each field found.
 
         Returns:
             Mapping[str, type]: Immutable mapping of field name to dependency type.
@@ -346,6 +397,8 @@ class AgentMeta(type):
         for attr_name, attr_type in annotations.items():
             if getattr(attr_type, "__origin__", None) is Depends:
                 dependencies[attr_name] = attr_type.__dependency_type__
+                if field_kinds is not None:
+                    field_kinds[attr_name] = "dependency"
 
         return MappingProxyType(dependencies)
 
@@ -426,20 +479,12 @@ class AgentMeta(type):
         Returns:
             Type[BaseModel]: A dynamically created Pydantic model.
         """
-        sig = inspect.signature(cls.__call__)
-        hints = get_type_hints(cls.__call__)
-        hints.pop("return", None)
-        hints.pop("self", None)
-
         fields: dict[str, Any] = {}
-        for name, param in sig.parameters.items():
-            if name == "self":
-                continue
-            annotation = hints.get(name, str)
-            if param.default is inspect.Parameter.empty:
+        for name, annotation, default in _call_params(cls.__call__):
+            if default is inspect.Parameter.empty:
                 fields[name] = (annotation, Field(...))
             else:
-                fields[name] = (annotation, Field(default=param.default))
+                fields[name] = (annotation, Field(default=default))
 
         return create_model(f"{cls.__name__}Request", **fields)
 
@@ -507,13 +552,17 @@ class AgentMeta(type):
         return StreamEvent
 
     @staticmethod
-    def _build_init_signature(agent_cls: Type[Agent]) -> inspect.Signature:
+    def _build_init_signature(
+        agent_cls: Type[Agent], field_kinds: Mapping[str, str]
+    ) -> inspect.Signature:
         """
         Builds __init__ signature with all non-default (required) params
         before any defaulted (optional) params.
 
         Args:
             agent_cls (Type[Agent]): The agent class being constructed
+            field_kinds (Mapping[str, str]): Kinds recorded by the extractors; fields
+                missing from it are plain fields
 
         Returns:
             inspect.Signature: The constructed __init__ signature
@@ -526,8 +575,9 @@ class AgentMeta(type):
         agents: list[inspect.Parameter] = []  # Linked agents (always optional, go last)
 
         for field_name, field_type in agent_cls.__annotations__.items():
+            kind = field_kinds.get(field_name, "field")
             # State fields are always optional (have defaults or default_factory)
-            if field_name in agent_cls.__state_defs__:
+            if kind == "state":
                 param = inspect.Parameter(
                     field_name,
                     inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -536,7 +586,7 @@ class AgentMeta(type):
                 )
                 optional.append(param)
             # Linked agents are optional by default (can be None)
-            elif field_name in agent_cls.__linked_agents__:
+            elif kind == "agent":
                 # Get default from AgentInfo if available
                 linked_def = agent_cls.__linked_agents__[field_name]
                 default = linked_def.info.get_default() if linked_def.info else None
@@ -548,11 +598,11 @@ class AgentMeta(type):
                 )
                 agents.append(param)
             # MCP fields are config-only, not constructor args
-            elif field_name in agent_cls.__mcp_defs__:
+            elif kind == "mcp":
                 continue
             # Dependency-injected fields are optional (default None); they are
             # supplied at serve time or passed explicitly for direct/test use.
-            elif field_name in agent_cls.__dependencies__:
+            elif kind == "dependency":
                 param = inspect.Parameter(
                     field_name,
                     inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -598,12 +648,18 @@ class AgentMeta(type):
                 # Add all state fields to compiled dict, validating types as we go
                 if name in kwargs:
                     val = kwargs[name]
-                    try:
-                        check_type(val, definition.model)
-                    except TypeCheckError:
-                        raise UnexpectedStateItemType(
-                            name=name, expected=definition.model, recieved=type(val)
-                        )
+                    if definition.validator is not None:
+                        if not definition.validator(val):
+                            raise UnexpectedStateItemType(
+                                name=name, expected=definition.model, recieved=type(val)
+                            )
+                    else:
+                        try:
+                            check_type(val, definition.model)
+                        except TypeCheckError:
+                            raise UnexpectedStateItemType(
+                                name=name, expected=definition.model, recieved=type(val)
+                            )
                     compiled[name] = val
                 else:
                     compiled[name] = definition.info.get_default()
@@ -685,62 +741,64 @@ class AgentMeta(type):
                 __system_message__ is defined in the class
         """
 
-        # Create an inherited namespace by combining all bases in MRO order
-        # Uses c3linearize to determine the order, allowing users to extend other Agents
-        # and/or any mixins. Mixins are classes that do not extend Agent, but can offer
-        # Agent attributes like tools, state fields, and/or linked agents
-        inherited_namespace = mcs._inherited_namespace_from_bases(bases)
-
         # Declare the new Agent subclass
         # If this is the base agent being declared (usually on import), then the initialization
         # of tools, state fields, etc. will be skipped, and this class will be stored in the
         # metaclass for future use. All other Agent subclasses will have __abstract_base__
         # marked as False. Since system message is not inherited, an exception is raised if
         # the user does not supply one
-        with mcs._lock:
-            cls = super().__new__(mcs, name, bases, namespace, **kwargs)
-            # If this is the base Agent, store it and return early
-            if namespace.get("__abstract_base__", False):
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        # If this is the base Agent, store it and return early. This is the only state
+        # shared across class creations; everything else is written to the new class,
+        # which nothing else can reference yet
+        if namespace.get("__abstract_base__", False):
+            with mcs._lock:
                 mcs.__BaseAgent__ = cls
-                return cls
-            cls.__abstract_base__ = False
-            # Resolve instructions; __system_message__ is the deprecated spelling
-            # and normalizes onto __instructions__
-            declared = None
-            if "__instructions__" in namespace:
-                declared = namespace["__instructions__"]
-            elif "__system_message__" in namespace:
-                warnings.warn(
-                    f"`__system_message__` on {name} is deprecated; "
-                    "declare `__instructions__` instead",
-                    DeprecationWarning,
-                    stacklevel=2,
-                )
-                declared = namespace["__system_message__"]
+            return cls
 
-            inherited_instructions = inherited_namespace.get(
-                "__instructions__", inherited_namespace.get("__system_message__")
+        # Create an inherited namespace by combining all bases in MRO order
+        # Uses the class's C3 MRO to determine the order, allowing users to extend other
+        # Agents and/or any mixins. Mixins are classes that do not extend Agent, but can
+        # offer Agent attributes like tools, state fields, and/or linked agents
+        inherited_namespace = mcs._inherited_namespace(cls)
+        cls.__abstract_base__ = False
+        # Resolve instructions; __system_message__ is the deprecated spelling
+        # and normalizes onto __instructions__
+        declared = None
+        if "__instructions__" in namespace:
+            declared = namespace["__instructions__"]
+        elif "__system_message__" in namespace:
+            warnings.warn(
+                f"`__system_message__` on {name} is deprecated; "
+                "declare `__instructions__` instead",
+                DeprecationWarning,
+                stacklevel=2,
             )
-            if declared is not None:
-                cls.__instructions__ = declared
-                # When overriding an ancestor's instructions, record the ancestor
-                # chain (oldest first) so the template can embed the parent's
-                # rendered instructions via `{{ super }}`
-                if inherited_instructions is not None:
-                    cls.__parent_instructions__ = (
-                        *inherited_namespace.get("__parent_instructions__", ()),
-                        inherited_instructions,
-                    )
-                else:
-                    cls.__parent_instructions__ = ()
-            elif inherited_instructions is not None:
-                # Instructions are inherited from the nearest ancestor;
-                # __parent_instructions__ resolves to the declaring ancestor's chain
-                cls.__instructions__ = inherited_instructions
+            declared = namespace["__system_message__"]
+
+        inherited_instructions = inherited_namespace.get(
+            "__instructions__", inherited_namespace.get("__system_message__")
+        )
+        if declared is not None:
+            cls.__instructions__ = declared
+            # When overriding an ancestor's instructions, record the ancestor
+            # chain (oldest first) so the template can embed the parent's
+            # rendered instructions via `{{ super }}`
+            if inherited_instructions is not None:
+                cls.__parent_instructions__ = (
+                    *inherited_namespace.get("__parent_instructions__", ()),
+                    inherited_instructions,
+                )
             else:
-                raise InstructionsNotDeclared()
-            # Keep the deprecated attribute readable for backwards compatibility
-            cls.__system_message__ = cls.__instructions__
+                cls.__parent_instructions__ = ()
+        elif inherited_instructions is not None:
+            # Instructions are inherited from the nearest ancestor;
+            # __parent_instructions__ resolves to the declaring ancestor's chain
+            cls.__instructions__ = inherited_instructions
+        else:
+            raise InstructionsNotDeclared()
+        # Keep the deprecated attribute readable for backwards compatibility
+        cls.__system_message__ = cls.__instructions__
 
         # Extract and attach Agent attributes:
         #
@@ -755,24 +813,30 @@ class AgentMeta(type):
         #
         # __linked_agents__: Linked agents extracted from annotations where the type is a
         #     subclass of Agent. These don't use namespace defaults, only annotations
-        tool_defs = mcs._extract_tool_defs(inherited_namespace | namespace)
         annotations = mcs._extract_annotations(inherited_namespace | namespace, bases, cls=cls)
         tool_defs = mcs._extract_tool_defs(inherited_namespace | namespace)
-        state_defs = mcs._extract_state_defs(annotations, inherited_namespace | namespace)
+        # Each extractor records the kind of the fields it claims in field_kinds, so the
+        # __init__ signature can branch on it without re-probing the definition mappings
+        field_kinds: dict[str, str] = {}
+        state_defs = mcs._extract_state_defs(
+            annotations, inherited_namespace | namespace, field_kinds
+        )
         state_tool_defs = mcs._generate_state_tools(cls, state_defs)
-        tool_defs = MappingProxyType({**tool_defs, **state_tool_defs})
+        if state_tool_defs:
+            tool_defs = MappingProxyType({**tool_defs, **state_tool_defs})
         linked_agents = mcs._extract_linked_agents(
-            annotations, inherited_namespace | namespace, mcs.__BaseAgent__
+            annotations, inherited_namespace | namespace, mcs.__BaseAgent__, field_kinds
+        )
+        mcp_defs = mcs._extract_mcp_defs(annotations, inherited_namespace | namespace, field_kinds)
+        dependencies = mcs._extract_dependencies(
+            annotations, inherited_namespace | namespace, field_kinds
         )
-        mcp_defs = mcs._extract_mcp_defs(annotations, inherited_namespace | namespace)
-        dependencies = mcs._extract_dependencies(annotations, inherited_namespace | namespace)
-        with mcs._lock:
-            cls.__tool_defs__ = tool_defs
-            cls.__annotations__ = annotations
-            cls.__state_defs__ = state_defs
-            cls.__linked_agents__ = linked_agents
-            cls.__mcp_defs__ = mcp_defs
-            cls.__dependencies__ = dependencies
+        cls.__tool_defs__ = tool_defs
+        cls.__annotations__ = annotations
+        cls.__state_defs__ = state_defs
+        cls.__linked_agents__ = linked_agents
+        cls.__mcp_defs__ = mcp_defs
+        cls.__dependencies__ = dependencies
 
         # Create response models at class declaration time, giving the agent a predetermined
         # output structure. This allows developers to know exactly what the output of the
@@ -786,7 +850,7 @@ class AgentMeta(type):
         #     using the tool response models and linked agent response models
         # Build tool response models for each tool
         tool_response_models = {
-            tool_name: ToolResponse.from_tool_def(tool_def)
+            tool_name: _tool_response_model(tool_def)
             for tool_name, tool_def in cls.__tool_defs__.items()
         }
         tool_response_model_list = list(tool_response_models.values())
@@ -840,13 +904,12 @@ class AgentMeta(type):
         # defined before this one (same guarantee relied on for __response_model__).
         ConstructModel = mcs._build_construct_model(cls)
 
-        with mcs._lock:
-            cls.__tool_response_models__ = MappingProxyType(tool_response_models)
-            cls.__response_model__ = ResponseModel
-            cls.__request_model__ = RequestModel
-            cls.__construct_model__ = ConstructModel
-            cls.__stream_event_model__ = StreamEventModel
-            cls.__state_class__ = StateClass
+        cls.__tool_response_models__ = MappingProxyType(tool_response_models)
+        cls.__response_model__ = ResponseModel
+        cls.__request_model__ = RequestModel
+        cls.__construct_model__ = ConstructModel
+        cls.__stream_event_model__ = StreamEventModel
+        cls.__state_class__ = StateClass
 
         # Build the custom __init__ method
         #
@@ -860,10 +923,9 @@ class AgentMeta(type):
         # The new init function creates an AgentState instance with the state field values,
         # attaches it to self.state, then attaches linked agent instances and other fields
         # as instance attributes
-        sig = mcs._build_init_signature(cls)
+        sig = mcs._build_init_signature(cls, field_kinds)
         __init__ = mcs._build_init(sig)
-        with mcs._lock:
-            cls.__init__ = __init__
+        cls.__init__ = __init__
 
         # Validation is commented out but can be enabled for additional runtime checks
         # _AgentConstructionValidator(cls).validate()
@@ -5,17 +5,36 @@ This module provides the `ref` object for creating lazy references to agent stat
 that are resolved at runtime when tools are called.
 """
 
-from pydantic import BaseModel
+from typing import Any, Callable
 
 
-class RefNode(BaseModel):
+def _compile_resolver(path: tuple[str, ...]) -> Callable[[dict], Any]:
+    """
+    Generates a resolver for a reference path as a single chain of subscripts, e.g.
+        `lambda agent_reference: agent_reference['self']['conversation']`.
+
+    Args:
+        path (tuple[str, ...]): The reference path; parts are attribute names
+
+    Returns:
+        Callable[[dict], Any]: Function returning the value at the path
+    """
+    subscripts = "".join(f"[{part!r}]" for part in path)
+    return eval(f"lambda agent_reference: agent_reference{subscripts}", {})
+
+
+class RefNode:
     """
     Represents a lazy dotted reference like ref.parent.conversation.goals.
     Allows building up nested references that are resolved later against an agent context.
     """
 
-    def __init__(self, path):
+    __slots__ = ("_path", "_resolver")
+
+    def __init__(self, path: tuple[str, ...]):
         self._path = path
+        # Compiled on first resolve, so intermediate nodes of ref.a.b.c never pay for it
+        self._resolver: Callable[[dict], Any] | None = None
 
     def __getattr__(self, key):
         """
@@ -26,8 +45,14 @@ class RefNode(BaseModel):
 
         Returns:
             RefNode: A new RefNode with the extended path
+
+        Raises:
+            AttributeError: For dunder lookups (copy, pickle, etc. probe for these) and for
+                slots before they are set
         """
-        return RefNode(self._path + [key])
+        if key.startswith("__") or key in RefNode.__slots__:
+            raise AttributeError(key)
+        return RefNode(self._path + (key,))
 
     def __call__(self, agent):
         """
@@ -41,6 +66,10 @@ class RefNode(BaseModel):
         """
         return self.resolve(agent)
 
+    def __reduce__(self):
+        # The compiled resolver is not picklable; rebuild it from the path instead
+        return (RefNode, (self._path,))
+
     def __repr__(self):
         """
         Returns a string representation of the reference path.
@@ -60,10 +89,10 @@ class RefNode(BaseModel):
         Returns:
             Any: The value at the end of the reference path
         """
-        target = agent_reference
-        for part in self._path:
-            target = target[part]
-        return target
+        resolver = self._resolver
+        if resolver is None:
+            resolver = self._resolver = _compile_resolver(self._path)
+        return resolver(agent_reference)
 
 
 class _RefRoot:
@@ -104,7 +133,7 @@ class _RefRoot:
         Returns:
             RefNode: A new RefNode initialized with the key
         """
-        return RefNode([key])
+        return RefNode((key,))
 
 
 ref = _RefRoot()
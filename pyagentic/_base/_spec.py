@@ -3,6 +3,9 @@ from typing import Any, Callable, Literal
 from pyagentic._base._info import StateInfo, ParamInfo, AgentInfo, MCPInfo, MaybeRef
 from pyagentic.policies._policy import Policy
 
+# Marks a `spec.State` default that was not given, since None is a valid default
+_NO_DEFAULT = object()
+
 
 class spec:
     """
@@ -54,7 +57,7 @@ class spec:
 
     @staticmethod
     def State(
-        default: Any = None,
+        default: Any = _NO_DEFAULT,
         default_factory: Callable = None,
         policies: list[Policy] = None,
         access: Literal["read", "write", "readwrite", "hidden"] = "read",
@@ -75,14 +78,16 @@ class spec:
         Returns:
             StateInfo: A configured StateInfo descriptor
         """
+        has_default = default is not _NO_DEFAULT
         return StateInfo(
-            default=default,
+            default=default if has_default else None,
             default_factory=default_factory,
             policies=policies,
             access=access,
             description=description,
             get_description=get_description,
             set_description=set_description,
+            has_default=has_default,
             **kwargs,
         )
 
@@ -1,12 +1,48 @@
-from typing import Any, TypeVar, Generic
-from dataclasses import dataclass
+from typing import Any, Callable, TypeVar, Generic
+from dataclasses import dataclass, field
 
 from pydantic import BaseModel
 
 from pyagentic._base._info import StateInfo
+from pyagentic._utils._typing import TypeCategory, analyze_type
 
 T = TypeVar("T")
 
+# typeguard applies the numeric tower (int is accepted for float, etc.), so these
+# cannot be checked with a plain isinstance
+_PROMOTED_TYPES = (float, complex, bytes)
+
+
+def _build_validator(model: Any) -> Callable[[Any], bool] | None:
+    """
+    Picks an isinstance-based validator for state types simple enough to not need typeguard.
+
+    Args:
+        model (Any): The type of the state field
+
+    Returns:
+        Callable[[Any], bool] | None: The validator, or None if typeguard must be used
+    """
+    type_info = analyze_type(model, BaseModel)
+
+    match type_info.category:
+        case TypeCategory.LIST_PRIMITIVE if type_info.inner_type not in _PROMOTED_TYPES:
+            inner = type_info.inner_type
+            return lambda value: isinstance(value, list) and all(
+                isinstance(item, inner) for item in value
+            )
+        case TypeCategory.PRIMITIVE | TypeCategory.SUBCLASS | TypeCategory.UNSUPPORTED:
+            # Plain classes (and Pydantic models) can be validated with isinstance;
+            # generics, unions, protocols and other special forms still need typeguard
+            if (
+                isinstance(model, type)
+                and not hasattr(model, "__origin__")
+                and model not in _PROMOTED_TYPES
+                and (type(model) is type or issubclass(model, BaseModel))
+            ):
+                return lambda value: isinstance(value, model)
+    return None
+
 
 class State(Generic[T]):
     """
@@ -55,7 +91,7 @@ class State(Generic[T]):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class _StateDefinition:
     """
     Internal definition of a state field combining model type and metadata.
@@ -65,3 +101,7 @@ class _StateDefinition:
 
     model: BaseModel
     info: StateInfo = None
+    validator: Callable[[Any], bool] | None = field(init=False, default=None)
+
+    def __post_init__(self):
+        self.validator = _build_validator(self.model)
@@ -1,13 +1,13 @@
 import inspect
+import weakref
 from typing import Callable, Any, TypeVar, get_type_hints, Self, Type
-from collections import defaultdict
-from copy import deepcopy
+from copy import copy
 from pydantic import BaseModel
 
 from pyagentic._base._info import ParamInfo
 from pyagentic._base._exceptions import InvalidToolDefinition
 
-from pyagentic._utils._typing import TypeCategory, analyze_type
+from pyagentic._utils._typing import TypeCategory, TypeInfo, analyze_type
 
 _TYPE_MAP: dict[Type[Any], str] = {
     int: "integer",
@@ -17,6 +17,110 @@ _TYPE_MAP: dict[Type[Any], str] = {
 }
 
 
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _passthrough_compiler(type_: Any, type_info: TypeInfo) -> Callable[[Any], Any]:
+    return _passthrough
+
+
+def _model_compiler(type_: Any, type_info: TypeInfo) -> Callable[[Any], Any]:
+    return type_.model_validate
+
+
+def _model_list_compiler(type_: Any, type_info: TypeInfo) -> Callable[[Any], Any]:
+    validate = type_info.inner_type.model_validate
+    return lambda value: [validate(item) for item in value]
+
+
+# Builds the function that compiles a raw tool call argument, per parameter category. The
+# compilers are bound to each param once, when the tool definition is built. Unsupported
+# categories have no entry and are left out of the compiled args
+_ARG_COMPILERS: dict[TypeCategory, Callable[[Any, TypeInfo], Callable[[Any], Any]]] = {
+    TypeCategory.PRIMITIVE: _passthrough_compiler,
+    TypeCategory.LIST_PRIMITIVE: _passthrough_compiler,
+    TypeCategory.SUBCLASS: _model_compiler,
+    TypeCategory.LIST_SUBCLASS: _model_list_compiler,
+}
+
+
+# Trusted constructors skip validation entirely: nested models stay plain dicts and
+# validators never run. Values that are already model instances are passed through as-is
+def _model_constructor(type_: Any, type_info: TypeInfo) -> Callable[[Any], Any]:
+    construct = type_.model_construct
+    return lambda value: value if isinstance(value, type_) else construct(**value)
+
+
+def _model_list_constructor(type_: Any, type_info: TypeInfo) -> Callable[[Any], Any]:
+    model = type_info.inner_type
+    construct = model.model_construct
+    return lambda value: [
+        item if isinstance(item, model) else construct(**item) for item in value
+    ]
+
+
+# Compilers for tools declared with `trusted_args=True`: models are built without validation
+_TRUSTED_ARG_COMPILERS: dict[TypeCategory, Callable[[Any, TypeInfo], Callable[[Any], Any]]] = {
+    **_ARG_COMPILERS,
+    TypeCategory.SUBCLASS: _model_constructor,
+    TypeCategory.LIST_SUBCLASS: _model_list_constructor,
+}
+
+# JSON schemas of Pydantic param models, split into the schema and its $defs. Built once per
+# model class and shared by every tool that takes the model, so they must not be mutated
+_model_schemas: "weakref.WeakKeyDictionary[Type[BaseModel], tuple[dict, dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _model_json_schema(model: Type[BaseModel]) -> tuple[dict, dict]:
+    """Returns the model's shared JSON schema without $defs, and the $defs it uses."""
+    parts = _model_schemas.get(model)
+    if parts is None:
+        schema = model.model_json_schema()
+        defs = schema.pop("$defs", {})
+        parts = _model_schemas[model] = (schema, defs)
+    return parts
+
+
+def _primitive_schema(type_: Any, type_info: TypeInfo, json_type: str, defs: dict) -> dict:
+    return {"type": json_type}
+
+
+def _primitive_list_schema(type_: Any, type_info: TypeInfo, json_type: str, defs: dict) -> dict:
+    return {"type": "array", "items": {"type": json_type}}
+
+
+def _model_schema(type_: Any, type_info: TypeInfo, json_type: str, defs: dict) -> dict:
+    model_schema, model_defs = _model_json_schema(type_)
+    # Move $defs to top level; copy the shared schema before metadata is added to it
+    defs.update(model_defs)
+    return dict(model_schema)
+
+
+def _model_list_schema(type_: Any, type_info: TypeInfo, json_type: str, defs: dict) -> dict:
+    item_schema, model_defs = _model_json_schema(type_info.inner_type)
+    # Move $defs to top level
+    defs.update(model_defs)
+    return {"type": "array", "items": item_schema}
+
+
+# Builds the JSON schema of a param, per parameter category. Unsupported categories have no
+# entry and get an empty schema
+_SCHEMA_BUILDERS: dict[TypeCategory, Callable[[Any, TypeInfo, str, dict], dict]] = {
+    TypeCategory.PRIMITIVE: _primitive_schema,
+    TypeCategory.LIST_PRIMITIVE: _primitive_list_schema,
+    TypeCategory.SUBCLASS: _model_schema,
+    TypeCategory.LIST_SUBCLASS: _model_list_schema,
+}
+
+
+# Shared info for tool params declared without a default. Infos are never mutated (resolve
+# returns a new instance), so every such param can point at the same one
+_REQUIRED_PARAM_INFO = ParamInfo(required=True)
+
+
 class _ToolDefinition:
     """
     Private class to handle tool definitions.
@@ -24,9 +128,12 @@ class _ToolDefinition:
     Attributes:
         name (str): Name of the tool, automatically filled out as the function name
         description (str): Description of the tool for LLM to read
-        parameters (str): Dictionary containing parameters captured by the tool descriptor
+        parameters (dict): Dictionary containing the (type, ParamInfo) of each parameter
+            captured by the tool descriptor
         condition (str): The condition supplied determining when this tool should be included
             in the LLM inference call
+        trusted_args (bool): Whether model args from strict-mode providers are built with
+            `model_construct` (no validation) instead of `model_validate`
 
     Methods:
         to_openai() -> dict: Converts the definition to an "openai-ready" dictionary
@@ -44,6 +151,7 @@ class _ToolDefinition:
         return_type: Type[Any],
         condition: Callable[[Any], bool] = None,
         phases: list[str] = None,
+        trusted_args: bool = False,
     ):
         self.name: str = name
         self.description: str = description
@@ -51,101 +159,181 @@ class _ToolDefinition:
         self.condition = condition
         self.return_type = return_type
         self.phases = phases if phases else []
+        self.trusted_args = trusted_args
 
-    def resolve(self, agent_reference: dict) -> Self:
-        new_parameters = {}
-
-        for name, (type_, default) in self.parameters.items():
-            if isinstance(default, ParamInfo):
-                new_default = default.resolve(agent_reference)
-            else:
-                new_default = default
-
-            new_parameters[name] = (type_, new_default)
-
-        return self.__class__(
-            name=self.name,
-            description=self.description,
-            parameters=new_parameters,
-            condition=self.condition,
-            return_type=self.return_type,
-            phases=self.phases,
+        # Parameter types are fixed at decoration, so analyze them and resolve their
+        # JSON-schema type names once instead of on every spec export / tool call
+        self._type_infos = {
+            name: analyze_type(type_, BaseModel) for name, (type_, _) in parameters.items()
+        }
+        self._json_types = {
+            name: _TYPE_MAP.get(type_info.effective_type, "string")
+            for name, type_info in self._type_infos.items()
+        }
+        self._arg_compilers: dict[str, Callable[[Any], Any]] = {}
+        for name, (type_, _) in parameters.items():
+            type_info = self._type_infos[name]
+            if type_info.category in _ARG_COMPILERS:
+                self._arg_compilers[name] = _ARG_COMPILERS[type_info.category](type_, type_info)
+        # Unvalidated model construction is only used for args the provider generated
+        # against a strict schema; other calls keep validating
+        self._strict_arg_compilers = self._arg_compilers
+        if trusted_args:
+            self._strict_arg_compilers = {}
+            for name, (type_, _) in parameters.items():
+                type_info = self._type_infos[name]
+                if type_info.category in _TRUSTED_ARG_COMPILERS:
+                    self._strict_arg_compilers[name] = _TRUSTED_ARG_COMPILERS[
+                        type_info.category
+                    ](type_, type_info)
+        # Tools taking only primitives (the common shape) pass args through untouched, so
+        # compile_args can merge them over the defaults directly
+        self._passthrough_args = all(
+            self._arg_compilers.get(name) is _passthrough for name in parameters
         )
+        self._arg_defaults = {name: info.default for name, (_, info) in parameters.items()}
+
+        # Tools without any refs in their ParamInfos export the same spec every time,
+        # so resolving is a no-op and the exported spec can be memoized
+        self._ref_params = frozenset(
+            name
+            for name, (_, info) in parameters.items()
+            if info.has_refs()
+        )
+        self._has_refs = bool(self._ref_params)
+        self._openai_spec: dict | None = None
+        self._anthropic_spec: dict | None = None
+        self._openai_v1_spec: dict | None = None
+        # Schemas of the params without refs, shared with resolved copies of this definition
+        self._static_schema: tuple[dict, dict, frozenset[str]] | None = None
 
-    def to_openai_spec(self) -> dict:
+    def resolve(self, agent_reference: dict) -> Self:
+        if not self._has_refs:
+            return self
+
+        new_parameters = dict(self.parameters)
+        for name in self._ref_params:
+            type_, default = new_parameters[name]
+            new_parameters[name] = (type_, default.resolve(agent_reference))
+
+        # Param types are unchanged by resolving, so the copy keeps the type infos, JSON
+        # types and arg compilers analyzed for this definition instead of rebuilding them
+        resolved = copy(self)
+        resolved.parameters = new_parameters
+        resolved._arg_defaults = {
+            name: info.default for name, (_, info) in new_parameters.items()
+        }
+        resolved._ref_params = frozenset()
+        resolved._has_refs = False
+        resolved._openai_spec = None
+        resolved._anthropic_spec = None
+        resolved._openai_v1_spec = None
+        # Only the params with refs change on resolve, so the copy only has to build those
+        resolved._static_schema = self._get_static_schema()
+        return resolved
+
+    def _get_static_schema(self) -> tuple[dict, dict, frozenset[str]]:
         """
-        Converts the definition to an OpenAI-ready dictionary.
+        Builds, once, the property schemas of all params without refs.
 
         Returns:
-            dict: An OpenAI-compliant tool specification dictionary
+            tuple[dict, dict, frozenset[str]]: The property schemas by param name, the $defs
+                they use, and the names of the required ones
         """
-        params = defaultdict(dict)
-        required = []
-        top_level_defs = {}
-
-        for name, (type_, default) in self.parameters.items():
-            type_info = analyze_type(type_, BaseModel)
+        if self._static_schema is None:
+            properties = {}
+            defs = {}
+            required = set()
+            for name, (type_, info) in self.parameters.items():
+                if name not in self._ref_params:
+                    properties[name] = self._param_schema(name, type_, info, defs)
+                    if info.required:
+                        required.add(name)
+            self._static_schema = (properties, defs, frozenset(required))
+        return self._static_schema
+
+    def _param_schema(
+        self, name: str, type_: Any, info: ParamInfo, top_level_defs: dict
+    ) -> dict:
+        """
+        Builds the JSON schema of a single param, moving any $defs into `top_level_defs`.
 
-            match type_info.category:
-                case TypeCategory.PRIMITIVE:
-                    params[name] = {"type": _TYPE_MAP.get(type_, "string")}
+        Args:
+            name (str): Name of the param
+            type_ (Any): Annotated type of the param
+            info (ParamInfo): Info of the param
+            top_level_defs (dict): Collects $defs of Pydantic model params
 
-                case TypeCategory.LIST_PRIMITIVE:
-                    params[name] = {
-                        "type": "array",
-                        "items": {"type": _TYPE_MAP.get(type_info.inner_type, "string")},
-                    }
+        Returns:
+            dict: The property schema of the param
+        """
+        type_info = self._type_infos[name]
+        builder = _SCHEMA_BUILDERS.get(type_info.category)
+        schema = (
+            builder(type_, type_info, self._json_types[name], top_level_defs)
+            if builder is not None
+            else {}
+        )
 
-                case TypeCategory.SUBCLASS:
-                    schema = deepcopy(type_.model_json_schema())
+        # Handle metadata
+        if info.description:
+            schema["description"] = info.description
+        if info.values:
+            if type_info.is_list:
+                # items may be a shared model schema, so extend a copy of it
+                schema["items"] = {**schema["items"], "enum": info.values}
+            else:
+                schema["enum"] = info.values
 
-                    # Move $defs to top level
-                    if "$defs" in schema:
-                        top_level_defs.update(schema.pop("$defs"))
+        return schema
 
-                    params[name] = schema
+    def to_openai_spec(self) -> dict:
+        """
+        Converts the definition to an OpenAI-ready dictionary.
 
-                case TypeCategory.LIST_SUBCLASS:
-                    schema = deepcopy(type_info.inner_type.model_json_schema())
+        The spec of a tool without refs is built once and reused; callers must treat the
+            returned dictionary as read-only.
 
-                    # Move $defs to top level
-                    if "$defs" in schema:
-                        top_level_defs.update(schema.pop("$defs"))
+        Returns:
+            dict: An OpenAI-compliant tool specification dictionary
+        """
+        if self._openai_spec is not None:
+            return self._openai_spec
 
-                    params[name] = {
-                        "type": "array",
-                        "items": schema,
-                    }
+        static_properties, static_defs, static_required = self._get_static_schema()
+        properties = {}
+        required = []
+        top_level_defs = dict(static_defs)
 
-            # Handle defaults and metadata
-            if isinstance(default, ParamInfo):
-                if default.description:
-                    params[name]["description"] = default.description
-                if default.required:
+        for name, (type_, info) in self.parameters.items():
+            if name in static_properties:
+                properties[name] = static_properties[name]
+                if name in static_required:
+                    required.append(name)
+            else:
+                properties[name] = self._param_schema(name, type_, info, top_level_defs)
+                if info.required:
                     required.append(name)
-                if default.values:
-                    if type_info.is_list:
-                        params[name]['items']["enum"] = default.values
-                    else:
-                        params[name]["enum"] = default.values
-
 
         # Final structure
         parameters = {
             "type": "object",
-            "properties": dict(params),
+            "properties": properties,
             "required": required,
         }
 
         if top_level_defs:
             parameters["$defs"] = top_level_defs
 
-        return {
+        spec = {
             "type": "function",
             "name": self.name,
             "description": self.description,
             "parameters": parameters,
         }
+        if not self._has_refs:
+            self._openai_spec = spec
+        return spec
 
     @staticmethod
     def _enforce_strict_schema(schema: dict) -> dict:
@@ -173,29 +361,42 @@ class _ToolDefinition:
         Claude's tool inputs match the schema exactly via grammar-constrained
         sampling — mirroring OpenAI's strict mode behaviour.
 
+        Like `to_openai_spec`, the spec of a tool without refs is built once and reused.
+
         Returns:
             dict: An Anthropic-compliant tool specification dictionary
         """
+        if self._anthropic_spec is not None:
+            return self._anthropic_spec
+
         openai_spec = self.to_openai_spec()
 
         input_schema = dict(openai_spec.get("parameters", {"type": "object", "properties": {}}))
         input_schema = self._enforce_strict_schema(input_schema)
 
-        return {
+        spec = {
             "name": openai_spec.get("name", self.name),
             "description": openai_spec.get("description", self.description),
             "strict": True,
             "input_schema": input_schema,
         }
+        if not self._has_refs:
+            self._anthropic_spec = spec
+        return spec
 
     def to_openai_v1(self):
-        openai_spec = self.to_openai_spec()
-        openai_spec.pop("type")
-        v1_spec = {"type": "function", "function": {**openai_spec}}
-        v1_spec["function"]["strict"] = True
-        return v1_spec
+        if self._openai_v1_spec is not None:
+            return self._openai_v1_spec
 
-    def compile_args(self, **kwargs) -> dict[str, Any]:
+        openai_spec = self.to_openai_spec()
+        function = {key: value for key, value in openai_spec.items() if key != "type"}
+        function["strict"] = True
+        spec = {"type": "function", "function": function}
+        if not self._has_refs:
+            self._openai_v1_spec = spec
+        return spec
+
+    def compile_args(self, strict: bool = False, /, **kwargs) -> dict[str, Any]:
         """
         Converts any raw kwargs, usually from LLM tool call, to match that of the tool definition.
         This process does the following:
@@ -203,37 +404,38 @@ class _ToolDefinition:
           - Casts a raw dictionary to any arg that is a Param class
 
         Args:
+            strict (bool): Whether the args were generated against a strict-mode tool spec.
+                Only then are model args of `trusted_args` tools built without validation.
+                Positional-only, so it never clashes with a tool parameter name
             **kwargs: Receives any arguments that will be verified and compiled
 
         Returns:
             dict[str, Any]: Dictionary of args that are ready to be run through the tool
         """
+        # Fast path: nothing to convert, and the LLM sent no unknown args to drop
+        if self._passthrough_args and kwargs.keys() <= self._arg_defaults.keys():
+            return {**self._arg_defaults, **kwargs}
+
         compiled_args = {}
+        arg_compilers = self._strict_arg_compilers if strict else self._arg_compilers
 
         for name, (type_, info) in self.parameters.items():
             if name in kwargs:
-                type_info = analyze_type(type_, BaseModel)
-
-                match type_info.category:
-                    case TypeCategory.PRIMITIVE:
-                        compiled_args[name] = kwargs[name]
-                    case TypeCategory.LIST_PRIMITIVE:
-                        compiled_args[name] = kwargs[name]
-                    case TypeCategory.SUBCLASS:
-                        param_args = kwargs[name]
-                        compiled_args[name] = type_.model_validate(param_args)
-                    case TypeCategory.LIST_SUBCLASS:
-                        compiled_args[name] = [
-                            type_info.inner_type.model_validate(param_args)
-                            for param_args in kwargs[name]
-                        ]
+                compiler = arg_compilers.get(name)
+                if compiler is not None:
+                    compiled_args[name] = compiler(kwargs[name])
             else:
                 compiled_args[name] = info.default
 
         return compiled_args
 
 
-def tool(description: str, condition: Callable[[Any], bool] = None, phases: list[str] = None):
+def tool(
+    description: str,
+    condition: Callable[[Any], bool] = None,
+    phases: list[str] = None,
+    trusted_args: bool = False,
+):
     """
     Decorator to mark an agent method as a tool that the LLM can call.
 
@@ -246,6 +448,10 @@ def tool(description: str, condition: Callable[[Any], bool] = None, phases: list
             to decide when to call the tool. Be specific and action-oriented.
         condition (Callable[[Any], bool], optional): Function that returns True/False to
             conditionally enable/disable the tool. Receives the agent instance (self).
+        trusted_args (bool, optional): Build Pydantic model args with `model_construct`,
+            skipping validation, when the provider generated them against a strict-mode tool
+            spec (Anthropic). Other providers keep validating. Only enable this for flat
+            models without validators; nested models are left as dicts. Defaults to False.
 
     Returns:
         Callable: Decorated method that can be called by the LLM
@@ -272,8 +478,13 @@ def tool(description: str, condition: Callable[[Any], bool] = None, phases: list
     """
 
     def decorator(fn: Callable):
-        # Check return type
-        types = get_type_hints(fn)
+        # Check return type. Plain class annotations need no evaluation, so skip
+        # get_type_hints unless there are strings, generics or special forms to resolve
+        annotations = fn.__annotations__
+        if all(isinstance(annotation, type) for annotation in annotations.values()):
+            types = dict(annotations)
+        else:
+            types = get_type_hints(fn)
         return_type = types.pop("return", None)
 
         # 2) grab default values
@@ -293,7 +504,7 @@ def tool(description: str, condition: Callable[[Any], bool] = None, phases: list
             elif default is not None:
                 params[name] = (type_, ParamInfo(default=default))
             else:
-                params[name] = (type_, ParamInfo(required=True))
+                params[name] = (type_, _REQUIRED_PARAM_INFO)
 
         fn.__tool_def__ = _ToolDefinition(
             name=fn.__name__,
@@ -302,6 +513,7 @@ def tool(description: str, condition: Callable[[Any], bool] = None, phases: list
             condition=condition,
             return_type=return_type,
             phases=phases,
+            trusted_args=trusted_args,
         )
         return fn
 
@@ -1,6 +1,16 @@
-from typing import Type, get_args
+from functools import cached_property, lru_cache
+from types import UnionType
+from typing import Any, Callable, Type, Union, get_args, get_origin
 from typeguard import check_type, TypeCheckError
 
+from pyagentic._base._info import _ref_fields
+from pyagentic._base._ref import RefNode
+from pyagentic._base._state import _build_validator
+
+
+# Types whose str() cannot fail, so they skip the trial conversion
+_STRINGABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 # Placeholder class for Agent type annotation.
 # Can't import actual agent as it would cause a circular import error.
@@ -8,6 +18,39 @@ class Agent:
     pass
 
 
+@lru_cache(maxsize=None)
+def _checker_for(expected_type: Any) -> Callable[[Any], bool]:
+    """
+    Builds a predicate that checks a value against a type, once per type.
+
+    Plain classes, lists of primitives and unions of those are checked with isinstance;
+        anything more exotic falls back to typeguard.
+
+    Args:
+        expected_type (Any): The type values are checked against
+
+    Returns:
+        Callable[[Any], bool]: Returns whether a value matches the type
+    """
+    validator = _build_validator(expected_type)
+    if validator is not None:
+        return validator
+
+    if get_origin(expected_type) in (Union, UnionType):
+        checks = tuple(_build_validator(arg) for arg in get_args(expected_type))
+        if all(check is not None for check in checks):
+            return lambda value: any(check(value) for check in checks)
+
+    def _typeguard_check(value: Any) -> bool:
+        try:
+            check_type(value, expected_type)
+        except TypeCheckError:
+            return False
+        return True
+
+    return _typeguard_check
+
+
 class AgentValidationError(Exception):
     """
     Exception raised when an Agent class fails validation checks.
@@ -31,7 +74,53 @@ class _AgentConstructionValidator:
     def __init__(self, AgentClass: Type["Agent"]):
         self.problems = []
         self.AgentClass = AgentClass
-        self.sample_agent = self.AgentClass(model="openai::validation", api_key="validation")
+
+    @cached_property
+    def sample_agent(self) -> "Agent":
+        """
+        A sample agent built from default values, constructed only once a check needs it.
+        """
+        return self.AgentClass(
+            model="openai::validation", api_key="validation", **self._state_defaults
+        )
+
+    @cached_property
+    def _state_defaults(self) -> dict[str, Any]:
+        """
+        Declared state defaults, with each default factory called once and reused by both
+            the default value check and the sample agent.
+        """
+        defaults = {}
+        for state_name, state_def in self.AgentClass.__state_defs__.items():
+            info = state_def.info
+            # Fields without a declared default have nothing to check; an explicit
+            # `default=None` is still checked
+            if info is None or not (
+                info.has_default
+                or info.default is not None
+                or info.default_factory is not None
+            ):
+                continue
+            defaults[state_name] = info.default_factory() if info.default_factory else info.default
+        return defaults
+
+    @cached_property
+    def _agent_reference(self) -> dict:
+        """
+        The sample agent's reference dict that refs are resolved against.
+        """
+        return self.sample_agent.agent_reference
+
+    @cached_property
+    def _state_samples(self) -> dict[str, Any]:
+        """
+        The sample agent's state values, fetched once through ``state.get`` so GET policies
+            run a single time per field.
+        """
+        if not self.AgentClass.__state_defs__:
+            return {}
+        state = self.sample_agent.state
+        return {name: state.get(name) for name in self.AgentClass.__state_defs__}
 
     def validate(self):
         """
@@ -41,13 +130,37 @@ class _AgentConstructionValidator:
             AgentValidationError: A custom exception that includes all problems found in the
                 validation pipeline.
         """
+        # Nothing to check, so skip building a sample agent altogether
+        if not self.AgentClass.__tool_defs__ and not self.AgentClass.__state_defs__:
+            return
+
         self._verify_default_values(self.AgentClass)
+        # The remaining checks need a sample agent, which can't be built from bad defaults
+        if self.problems:
+            raise AgentValidationError(self.problems)
+
         self._verify_state_items_can_be_strings(self.AgentClass)
         self._verify_tool_state_refs(self.AgentClass)
 
         if self.problems:
             raise AgentValidationError(self.problems)
 
+    def _verify_default_values(self, AgentClass: Type["Agent"]):
+        """
+        Verifies that all declared state defaults match the type of their state field.
+        """
+        # Checked before the sample agent exists, since a bad default stops it being built
+        for state_name, default in self._state_defaults.items():
+            state_def = AgentClass.__state_defs__[state_name]
+            if not _checker_for(state_def.model)(default):
+                self.problems.append(
+                    (
+                        f"state.{state_name}: Default value does not match state type:\n"
+                        f"  Expected: {state_def.model}\n"
+                        f"  Received: {type(default).__name__}\n"
+                    )
+                )
+
     def _verify_tool_state_refs(self, AgentClass: Type["Agent"]):
         """
         Verifies that all state refs used:
@@ -55,22 +168,24 @@ class _AgentConstructionValidator:
           - The linked state item has the same type as the field it is being used in
         """
         for tool_name, tool_def in AgentClass.__tool_defs__.items():
-            for param_name, (param_type, param_info) in tool_def.parameters.items():
-                for info_field in param_info._get_maybe_state():
-                    attr = getattr(param_info, info_field.name)
-                    expected_type = get_args(info_field.type)[0]
-                    if isinstance(attr, any):
-                        if attr.path not in AgentClass.__state_attrs__:
+            # Only params whose info holds refs need checking
+            for param_name in tool_def._ref_params:
+                _, param_info = tool_def.parameters[param_name]
+                for field_name, expected_type in _ref_fields(type(param_info)):
+                    attr = getattr(param_info, field_name)
+                    # Exact type check; refs are always plain RefNodes
+                    if type(attr) is RefNode:
+                        try:
+                            sample_value = attr.resolve(self._agent_reference)
+                        except (KeyError, TypeError):
                             self.problems.append(
-                                f"tool.{tool_name}.param.{param_name}.{info_field.name}: Ref not found in state: {attr.path}"  # noqa E501
+                                f"tool.{tool_name}.param.{param_name}.{field_name}: Ref not found in state: {attr!r}"  # noqa E501
                             )
-                        sample_value = self.sample_agent.state.get(attr.path)
-                        try:
-                            check_type(sample_value, expected_type)
-                        except TypeCheckError:
+                            continue
+                        if not _checker_for(expected_type)(sample_value):
                             self.problems.append(
                                 (
-                                    f"tool.{tool_name}.param.{param_name}.{info_field.name}: Ref typing does not match param info field:\n"  # noqa E501
+                                    f"tool.{tool_name}.param.{param_name}.{field_name}: Ref typing does not match param info field:\n"  # noqa E501
                                     f"  Expected: {expected_type}\n"
                                     f"  Recieved: {type(sample_value).__name__}\n"
                                 )
@@ -81,8 +196,10 @@ class _AgentConstructionValidator:
         Verifies that all items in the state can be injected and used in the system message or
             input template.
         """
-        for state_name in AgentClass.__state_attrs__.keys():
-            sample_value = self.sample_agent.state.get(state_name)
+        for state_name, sample_value in self._state_samples.items():
+            # Builtin scalars always stringify; only other values need a trial str()
+            if type(sample_value) in _STRINGABLE_TYPES:
+                continue
             try:
                 str(sample_value)
             except Exception:
@@ -1,9 +1,10 @@
 from typing import get_origin, get_args, Any, Optional, ForwardRef
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 
 
-PRIMITIVES = (bool, str, int, float, type(None))
+PRIMITIVES = frozenset({bool, str, int, float, type(None)})
 
 
 def is_primitive(type_: Any) -> bool:
@@ -16,7 +17,11 @@ def is_primitive(type_: Any) -> bool:
     Returns:
         bool: True if the type is a primitive, False otherwise
     """
-    return type_ in PRIMITIVES
+    try:
+        return type_ in PRIMITIVES
+    except TypeError:
+        # Unhashable annotations can't be primitives
+        return False
 
 
 class TypeCategory(Enum):
@@ -31,77 +36,89 @@ class TypeCategory(Enum):
     UNSUPPORTED = "unsupported"
 
 
-@dataclass
+_FORWARD_REF_TYPES = (str, ForwardRef)
+
+
+def _is_forward_ref(t: Any) -> bool:
+    """
+    Returns whether a type is a forward reference: a string from a deferred annotation,
+    a typing.ForwardRef, or anything that looks like one (internal shape has varied, so
+    duck-type too).
+    """
+    if t is None:
+        return False
+    return isinstance(t, _FORWARD_REF_TYPES) or hasattr(t, "__forward_arg__")
+
+
+_LIST_CATEGORIES = frozenset({TypeCategory.LIST_PRIMITIVE, TypeCategory.LIST_SUBCLASS})
+_SUBCLASS_CATEGORIES = frozenset({TypeCategory.SUBCLASS, TypeCategory.LIST_SUBCLASS})
+
+
+@dataclass(frozen=True, slots=True)
 class TypeInfo:
     """
-    Normalized information about a type, including category and inner types.
+    Normalized information about a type, including category and inner types. Instances
+    are shared between callers of ``analyze_type``, so they are immutable.
+
+    Attributes:
+        is_list (bool): True if the category is a list type
+        is_subclass (bool): True if the category is a subclass type
+        effective_type (type): The type to work with (inner type for lists, base type
+            otherwise)
+        has_forward_ref (bool): True if either base_type or inner_type is a forward
+            reference (e.g., a string annotation or typing.ForwardRef)
     """
 
     category: TypeCategory
     base_type: type
     inner_type: Optional[type] = None  # For list types
 
-    @property
-    def is_list(self) -> bool:
-        """
-        Returns whether the type is a list type.
-
-        Returns:
-            bool: True if the category is a list type
-        """
-        return self.category in [TypeCategory.LIST_PRIMITIVE, TypeCategory.LIST_SUBCLASS]
-
-    @property
-    def is_subclass(self) -> bool:
-        """
-        Returns whether the type is a subclass of a base class.
-
-        Returns:
-            bool: True if the category is a subclass type
-        """
-        return self.category in [TypeCategory.SUBCLASS, TypeCategory.LIST_SUBCLASS]
-
-    @property
-    def effective_type(self) -> type:
-        """
-        Returns the type to work with (inner type for lists, base type otherwise).
-        """
-        return self.inner_type if self.is_list else self.base_type
-
-    @property
-    def has_forward_ref(self) -> bool:
-        """
-        True if either base_type or inner_type is a forward reference
-        (e.g., a string annotation or typing.ForwardRef). Safe across Python versions.
-        """
-
-        def _is_forward_ref(t) -> bool:
-            if t is None:
-                return False
-            # Strings from deferred annotations / forward refs
-            if isinstance(t, str):
-                return True
-            # typing.ForwardRef in 3.8+ (internal shape has varied, so duck-type too)
-            if isinstance(t, ForwardRef):
-                return True
-            # Fallback: anything that looks like a ForwardRef (duck-typing)
-            return hasattr(t, "__forward_arg__")  # covers older/private ForwardRef variants
-
-        return _is_forward_ref(self.base_type) or _is_forward_ref(self.inner_type)
+    # Derived once at construction, since they are read on every tool call
+    is_list: bool = field(init=False, repr=False, compare=False)
+    is_subclass: bool = field(init=False, repr=False, compare=False)
+    effective_type: type = field(init=False, repr=False, compare=False)
+    has_forward_ref: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        is_list = self.category in _LIST_CATEGORIES
+        object.__setattr__(self, "is_list", is_list)
+        object.__setattr__(self, "is_subclass", self.category in _SUBCLASS_CATEGORIES)
+        object.__setattr__(self, "effective_type", self.inner_type if is_list else self.base_type)
+        object.__setattr__(
+            self,
+            "has_forward_ref",
+            _is_forward_ref(self.base_type) or _is_forward_ref(self.inner_type),
+        )
 
 
 def analyze_type(type_: type, base_class: type) -> TypeInfo:
     """
-    Analyzes a type and returns normalized information about it.
+    Analyzes a type and returns normalized information about it. Results are cached per
+    ``(type_, base_class)``; unhashable annotations are analyzed uncached.
 
     Args:
         type_: The type to analyze
         base_class: Base class for checking subclass relationships
     """
+    # Check hashability up front, so TypeErrors raised by the analysis itself aren't
+    # mistaken for an uncacheable key
+    try:
+        hash((type_, base_class))
+    except TypeError:
+        return _analyze_type(type_, base_class)
+    return _analyze_type_cached(type_, base_class)
+
+
+@lru_cache(maxsize=None)
+def _analyze_type_cached(type_: type, base_class: type) -> TypeInfo:
+    return _analyze_type(type_, base_class)
+
+
+def _analyze_type(type_: type, base_class: type) -> TypeInfo:
     origin = get_origin(type_)
 
     try:
-        if origin == list:
+        if origin is list:
             inner_type = get_args(type_)[0]
             if is_primitive(inner_type):
                 return TypeInfo(TypeCategory.LIST_PRIMITIVE, type_, inner_type)
@@ -5,7 +5,8 @@ import functools
 def deprecated(reason: str = "", since: str | None = None, removed: str | None = None):
     """
     Decorator to mark functions or classes as deprecated.
-    Emits a DeprecationWarning when used.
+    Emits a DeprecationWarning when used; the active warning filters decide how often it
+    is shown (by default once per call site).
 
     Example:
         @deprecated("Use `new_func` instead.", since="0.10", removed="0.12")
@@ -13,22 +14,32 @@ def deprecated(reason: str = "", since: str | None = None, removed: str | None =
     """
 
     def decorator(obj):
-        message = f"{obj.__name__} is deprecated"
-        if since:
-            message += f" since {since}"
-        if reason:
-            message += f"; {reason}"
-        if removed:
-            message += f". It will be removed in {removed}."
-        else:
-            message += "."
+        message = None
+
+        def warn():
+            nonlocal message
+            # The message is only needed once the warning fires, so build it here
+            if message is None:
+                message = f"{obj.__name__} is deprecated"
+                if since:
+                    message += f" since {since}"
+                if reason:
+                    message += f"; {reason}"
+                if removed:
+                    message += f". It will be removed in {removed}."
+                else:
+                    message += "."
+            # Repeats are deduplicated per call site by the warnings registry and filters,
+            # so pytest.warns / catch_warnings still see every emission they ask for.
+            # stacklevel=3 points past this helper and the wrapper at the caller
+            warnings.warn(message, DeprecationWarning, stacklevel=3)
 
         if isinstance(obj, type):  # decorating a class
             orig_init = obj.__init__
 
             @functools.wraps(orig_init)
             def new_init(self, *args, **kwargs):
-                warnings.warn(message, DeprecationWarning, stacklevel=2)
+                warn()
                 return orig_init(self, *args, **kwargs)
 
             obj.__init__ = new_init
@@ -38,7 +49,7 @@ def deprecated(reason: str = "", since: str | None = None, removed: str | None =
 
             @functools.wraps(obj)
             def wrapper(*args, **kwargs):
-                warnings.warn(message, DeprecationWarning, stacklevel=2)
+                warn()
                 return obj(*args, **kwargs)
 
             return wrapper
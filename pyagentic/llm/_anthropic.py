@@ -32,6 +32,8 @@ class AnthropicProvider(LLMProvider):
     """
 
     __supports_structured_outputs__ = True
+    # Tools are sent with `to_anthropic_spec`, which enables strict mode
+    __strict_tool_schemas__ = True
 
     def __init__(self, model: str, api_key: str, **kwargs):
         """
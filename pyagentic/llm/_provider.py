@@ -27,11 +27,14 @@ class LLMProvider(ABC):
         __llm_name__: Human-readable name for the provider
         __supports_tool_calls__: Whether the provider supports function/tool calling
         __supports_structured_outputs__: Whether the provider supports structured response formats
+        __strict_tool_schemas__: Whether the provider sends tool specs in strict mode, so tool
+            call arguments are guaranteed to match the schema
     """
 
     __llm_name__ = "base"
     __supports_tool_calls__ = True
     __supports_structured_outputs__ = True
+    __strict_tool_schemas__ = False
 
     _model: str = None
 
@@ -5,7 +5,7 @@ from pyagentic._base._tool import _ToolDefinition
 from pyagentic._base._prompts import PromptSource
 from pyagentic._base._agent._agent_state import _AgentState
 
-from pyagentic._utils._typing import TypeCategory, analyze_type
+from pyagentic._utils._typing import TypeCategory
 from pyagentic.models.llm import ProviderInfo
 
 
@@ -34,8 +34,10 @@ class ToolResponse(BaseModel):
             Type[Self]: New ToolResponse subclass with tool parameters as fields
         """
         fields = {}
+        # Parameter types were already analyzed when the tool definition was built
+        type_infos = tool_def._type_infos
         for param_name, (param_type, param_info) in tool_def.parameters.items():
-            type_info = analyze_type(param_type, BaseModel)
+            type_info = type_infos[param_name]
             match type_info.category:
 
                 case TypeCategory.PRIMITIVE:
@@ -28,7 +28,7 @@ class SpanStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpanContext:
     """
     Immutable context information for a span.
@@ -41,7 +41,7 @@ class SpanContext:
     parent_span_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Span:
     """A light, tracer-agnostic span handle used by PyAgentic."""
 
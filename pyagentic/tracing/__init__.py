@@ -1,5 +1,6 @@
 from pyagentic.tracing._basic import BasicTracer
 from pyagentic.tracing._langfuse import LangfuseTracer
+from pyagentic.tracing._noop import NoopTracer
 
 
-__all__ = ["BasicTracer", "LangfuseTracer"]
+__all__ = ["BasicTracer", "LangfuseTracer", "NoopTracer"]
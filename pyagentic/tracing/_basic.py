@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 import time
-import uuid
 import threading
 from collections import defaultdict
 from typing import Optional, Dict, Any, List
 
-from pyagentic.tracing._tracer import AgentTracer
+from pyagentic.tracing._tracer import AgentTracer, _new_span_id, _new_trace_id
 from pyagentic.models.tracing import Span, SpanContext, SpanKind, SpanStatus
 
 
@@ -59,8 +58,8 @@ class BasicTracer(AgentTracer):
         Returns:
             Span: The newly created span
         """
-        trace_id = parent.context.trace_id if parent else uuid.uuid4().hex
-        span_id = uuid.uuid4().hex
+        trace_id = parent.context.trace_id if parent else _new_trace_id()
+        span_id = _new_span_id()
         parent_span_id = parent.context.span_id if parent else None
 
         ctx = SpanContext(trace_id=trace_id, span_id=span_id, parent_span_id=parent_span_id)
@@ -69,7 +68,7 @@ class BasicTracer(AgentTracer):
             kind=kind,
             context=ctx,
             start_ns=time.monotonic_ns(),
-            attributes=dict(attributes or {}),
+            attributes=dict(attributes) if attributes else {},
         )
 
         with self._lock:
@@ -104,7 +103,7 @@ class BasicTracer(AgentTracer):
         evt = {
             "name": name,
             "ts_ns": time.monotonic_ns(),
-            "attributes": dict(attributes or {}),
+            "attributes": dict(attributes) if attributes else {},
         }
         with self._lock:
             self._events[span.context.span_id].append(evt)
@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import time
-import uuid
 import threading
 from typing import Optional, Dict, Any, List, Tuple
 
-from pyagentic.tracing._tracer import AgentTracer
+from pyagentic.tracing._tracer import AgentTracer, _new_span_id, _new_trace_id
 from pyagentic.models.tracing import Span, SpanContext, SpanKind, SpanStatus
 
 try:
@@ -79,11 +78,11 @@ class LangfuseTracer(AgentTracer):
         - Parent/child: if a parent Span is provided, we create the child via the
           parent's wrapped observation, preserving nesting.
         """
-        attrs = dict(attributes or {})
+        attrs = dict(attributes) if attributes else {}
 
         # We create a pyagentic Span immediately for caller ergonomics.
-        trace_id = parent.context.trace_id if parent else uuid.uuid4().hex
-        span_id = uuid.uuid4().hex
+        trace_id = parent.context.trace_id if parent else _new_trace_id()
+        span_id = _new_span_id()
         parent_span_id = parent.context.span_id if parent else None
 
         ctx = SpanContext(trace_id=trace_id, span_id=span_id, parent_span_id=parent_span_id)
@@ -160,7 +159,7 @@ class LangfuseTracer(AgentTracer):
         """
         Attach a point-in-time event to the observation.
         """
-        meta = dict(attributes or {})
+        meta = dict(attributes) if attributes else {}
         with self._lock:
             wrapped_tuple = self._wrapped.get(span.context.span_id)
         if wrapped_tuple is None:
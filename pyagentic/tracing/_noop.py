@@ -0,0 +1,44 @@
+from typing import Optional, Dict, Any
+
+from pyagentic.tracing._tracer import AgentTracer, _NOOP_CONTEXT
+from pyagentic.models.tracing import Span, SpanKind
+
+
+class NoopTracer(AgentTracer):
+    """
+    Tracer that records nothing.
+
+    Use it to turn tracing off, e.g. in production runs without an observability backend.
+    Spans opened through it cost a flag check and a bare, unrecorded span.
+    """
+
+    __disabled__ = True
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind,
+        parent: Optional[Span] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Span:
+        """
+        Returns a fresh span that is never recorded.
+
+        Returns:
+            Span: The unrecorded span
+        """
+        return Span(name=name, kind=kind, context=_NOOP_CONTEXT, start_ns=0)
+
+    def end_span(self, span: Span) -> None:
+        """Does nothing."""
+
+    def _add_event(
+        self, span: Span, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Does nothing."""
+
+    def _set_attributes(self, span: Span, attributes: Dict[str, Any]) -> None:
+        """Does nothing."""
+
+    def _record_exception(self, span: Span, exc: BaseException) -> None:
+        """Does nothing."""
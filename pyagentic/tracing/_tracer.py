@@ -1,17 +1,44 @@
 import contextvars
 
 from functools import wraps
+from random import getrandbits
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from typing import Any, Dict, Optional, AsyncIterator, Callable
 
-from pyagentic.models.tracing import Span, SpanStatus, SpanKind
+from pyagentic.models.tracing import Span, SpanContext, SpanStatus, SpanKind
 
 
 _current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
     "pyagentic_current_span", default=None
 )
 
+# Context shared by the spans disabled tracers yield; those spans are never recorded or
+# made current. The context is immutable, but each span is fresh, since callers may mutate it
+_NOOP_CONTEXT = SpanContext("", "")
+
+
+def _new_trace_id() -> str:
+    """
+    Generates a random 128-bit trace id as 32 hex characters (W3C / OpenTelemetry sized).
+    Tracer implementations should use this over uuid4 in `start_span`; it is several times
+    cheaper per span.
+
+    Returns:
+        str: The new trace id
+    """
+    return f"{getrandbits(128):032x}"
+
+
+def _new_span_id() -> str:
+    """
+    Generates a random 64-bit span id as 16 hex characters (W3C / OpenTelemetry sized).
+
+    Returns:
+        str: The new span id
+    """
+    return f"{getrandbits(64):016x}"
+
 
 class AgentTracer(ABC):
     """
@@ -19,8 +46,13 @@ class AgentTracer(ABC):
 
     Implementations should override start_span/end_span/add_event/
         set_attributes/record_exception/record_tokens.
+
+    Tracers that record nothing should set `__disabled__ = True`; their spans then skip
+        span creation and the current-span context entirely.
     """
 
+    __disabled__: bool = False
+
     @property
     def current_span(self) -> Optional[Span]:
         """
@@ -173,6 +205,10 @@ class AgentTracer(ABC):
         attributes: Optional[Dict[str, Any]] = None,
         parent: Optional[Span] = None,
     ) -> AsyncIterator[Span]:
+        if self.__disabled__:
+            yield Span(name=name, kind=kind, context=_NOOP_CONTEXT, start_ns=0)
+            return
+
         parent = parent or _current_span.get()
         span = self.start_span(name=name, kind=kind, parent=parent, attributes=attributes)
         token = _current_span.set(span)
@@ -45,6 +45,19 @@ def test_param_info_with_ref():
     assert isinstance(info.description, RefNode)
 
 
+def test_ref_copy_and_pickle():
+    """Test that refs resolve the same after being resolved, copied, and pickled"""
+    import copy
+    import pickle
+
+    node = ref.self.conversation.goal
+    agent_reference = {"self": {"conversation": {"goal": "test"}}}
+
+    assert node(agent_reference) == "test"
+    assert copy.deepcopy(node)(agent_reference) == "test"
+    assert pickle.loads(pickle.dumps(node))(agent_reference) == "test"
+
+
 def test_param_info_resolve():
     """Test that ParamInfo.resolve resolves ref references"""
     info = spec.Param(description=ref.self.str_default.value, values=ref.self.enum_values)
@@ -56,6 +69,14 @@ def test_param_info_resolve():
     assert resolved_info.values == ["a", "b", "c"]
 
 
+def test_param_info_resolve_without_refs():
+    """Test that a ParamInfo without refs resolves to itself"""
+    info = spec.Param(description="static", values=["a", "b"])
+
+    assert not info.has_refs()
+    assert info.resolve({"self": {}}) is info
+
+
 def test_mcp_info_resolve_refs_in_args():
     """Test that MCPInfo.resolve resolves ref references nested in the args list"""
     info = spec.MCPLink(
@@ -199,3 +199,36 @@ def test_state_info_access_levels():
     for access_level in ["read", "write", "readwrite", "hidden"]:
         info = spec.State(default=4, access=access_level)
         assert info.access == access_level
+
+
+def test_agent_state_init_type_check():
+    """Test that state kwargs are type checked on both the validator and typeguard paths"""
+    from pyagentic._base._exceptions import UnexpectedStateItemType
+
+    class IntModel(BaseModel):
+        value: int = 0
+
+    class TestAgent(BaseAgent):
+        __system_message__ = "Test"
+
+        model_field: State[IntModel] = spec.State(default_factory=IntModel)
+        ratio: State[float] = spec.State(default=0.5)
+        values: State[list[int]] = spec.State(default_factory=list)
+
+    assert TestAgent.__state_defs__["model_field"].validator is not None
+    assert TestAgent.__state_defs__["ratio"].validator is None
+    assert TestAgent.__state_defs__["values"].validator is not None
+
+    # int is accepted for float, following typeguard's numeric promotion
+    agent = TestAgent(model="_mock::test-model", api_key="test", ratio=1, values=[1, 2])
+    assert agent.state.ratio == 1
+
+    with pytest.raises(UnexpectedStateItemType):
+        TestAgent(model="_mock::test-model", api_key="test", model_field="nope")
+
+    with pytest.raises(UnexpectedStateItemType):
+        TestAgent(model="_mock::test-model", api_key="test", values=["a"])
+
+    # Every list item is checked, not just the first
+    with pytest.raises(UnexpectedStateItemType):
+        TestAgent(model="_mock::test-model", api_key="test", values=[1, "a"])
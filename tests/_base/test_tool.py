@@ -1,7 +1,7 @@
 import pytest
 import asyncio
 from deepdiff import DeepDiff
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from pyagentic import tool, spec, BaseAgent, ref, State
 from pyagentic._base._tool import _ToolDefinition
@@ -481,3 +481,120 @@ def test_tool_condition_complex_logic():
     tools = asyncio.run(agent._get_tool_defs())
     tool_names = [tool.name for tool in tools]
     assert "complex_tool" in tool_names
+
+
+def test_tool_static_spec_is_reused():
+    """Test that tools without refs skip resolving and reuse their exported spec"""
+
+    @tool("Static tool")
+    def static(value: str = spec.Param(description="static")) -> str:
+        pass
+
+    @tool("Ref tool")
+    def dynamic(value: str = spec.Param(description=ref.self.value)) -> str:
+        pass
+
+    static_def: _ToolDefinition = static.__tool_def__
+    assert static_def.resolve({"self": {}}) is static_def
+    assert static_def.to_openai_spec() is static_def.to_openai_spec()
+
+    # to_openai_v1 must not mutate the shared spec
+    static_def.to_openai_v1()
+    assert static_def.to_openai_spec()["type"] == "function"
+    assert static_def.to_openai_v1() is static_def.to_openai_v1()
+    assert static_def.to_anthropic_spec() is static_def.to_anthropic_spec()
+
+    dynamic_def: _ToolDefinition = dynamic.__tool_def__
+    resolved = dynamic_def.resolve({"self": {"value": "resolved"}})
+    assert resolved is not dynamic_def
+    assert resolved.to_openai_spec()["parameters"]["properties"]["value"]["description"] == (
+        "resolved"
+    )
+
+
+def test_tool_resolved_spec_reuses_static_params():
+    """Test that resolving a tool only rebuilds the schemas of params with refs"""
+
+    @tool("Mixed tool")
+    def mixed(
+        fixed: int = spec.Param(description="fixed", required=True),
+        dynamic: str = spec.Param(description=ref.self.value),
+    ) -> str:
+        pass
+
+    tool_def: _ToolDefinition = mixed.__tool_def__
+    first = tool_def.resolve({"self": {"value": "first"}}).to_openai_spec()
+    second = tool_def.resolve({"self": {"value": "second"}}).to_openai_spec()
+
+    assert first["parameters"]["properties"]["fixed"] is second["parameters"]["properties"]["fixed"]
+    assert first["parameters"]["properties"]["dynamic"]["description"] == "first"
+    assert second["parameters"]["properties"]["dynamic"]["description"] == "second"
+    assert list(second["parameters"]["properties"]) == ["fixed", "dynamic"]
+    assert second["parameters"]["required"] == ["fixed"]
+
+
+def test_tool_trusted_args_skip_validation():
+    """Test that trusted_args tools skip validation only for args from strict-mode specs"""
+
+    class Options(BaseModel):
+        count: int
+
+    @tool("Validated tool")
+    def validated(options: Options) -> str:
+        pass
+
+    @tool("Trusted tool", trusted_args=True)
+    def trusted(options: Options, batch: list[Options]) -> str:
+        pass
+
+    with pytest.raises(ValidationError):
+        validated.__tool_def__.compile_args(True, options={"count": "not a number"})
+
+    # Without a strict-mode spec, trusted tools still validate
+    with pytest.raises(ValidationError):
+        trusted.__tool_def__.compile_args(options={"count": "not a number"}, batch=[])
+
+    compiled = trusted.__tool_def__.compile_args(
+        True, options={"count": "not a number"}, batch=[{"count": 1}]
+    )
+    assert isinstance(compiled["options"], Options)
+    assert compiled["options"].count == "not a number"
+    assert isinstance(compiled["batch"][0], Options)
+
+
+def test_tool_trusted_args_accept_model_instances():
+    """Test that trusted_args tools pass through args that are already model instances"""
+
+    class Options(BaseModel):
+        count: int
+
+    @tool("Trusted tool", trusted_args=True)
+    def trusted(options: Options, batch: list[Options]) -> str:
+        pass
+
+    options = Options(count=1)
+    item = Options(count=2)
+    compiled = trusted.__tool_def__.compile_args(
+        True, options=options, batch=[item, {"count": 3}]
+    )
+    assert compiled["options"] is options
+    assert compiled["batch"][0] is item
+    assert isinstance(compiled["batch"][1], Options)
+
+
+def test_tool_primitive_compile_args():
+    """Test that primitive-only tools fill defaults and drop args they do not declare"""
+
+    @tool("Primitive tool")
+    def primitive(
+        query: str, limit: int = spec.Param(default=5), tags: list[str] = spec.Param()
+    ) -> str:
+        pass
+
+    tool_def: _ToolDefinition = primitive.__tool_def__
+    assert tool_def.compile_args(query="a") == {"query": "a", "limit": 5, "tags": None}
+    assert tool_def.compile_args(query="a", limit=1, unknown=True) == {
+        "query": "a",
+        "limit": 1,
+        "tags": None,
+    }
@@ -80,3 +80,89 @@ def test_validator_accumulates_problems():
     validator = _AgentConstructionValidator(TestAgent)
     assert hasattr(validator, "problems")
     assert isinstance(validator.problems, list)
+
+
+def test_validator_validate_passes_for_matching_defaults_and_refs():
+    """Test that validate runs all checks and passes for a well-formed agent"""
+
+    class TestAgent(BaseAgent):
+        __system_message__ = "Test"
+
+        name: State[str] = spec.State(default="bob")
+        count: State[int] = spec.State(default_factory=lambda: 3)
+
+        @tool("Test tool with ref")
+        def test_tool(self, value: str = spec.Param(description=ref.self.name)) -> str:
+            return value
+
+    validator = _AgentConstructionValidator(TestAgent)
+    validator.validate()
+    assert validator.problems == []
+
+
+def test_validator_validate_reports_bad_ref_type():
+    """Test that validate reports a ref whose state value doesn't match the info field"""
+
+    class TestAgent(BaseAgent):
+        __system_message__ = "Test"
+
+        count: State[int] = spec.State(default=3)
+
+        @tool("Test tool with ref")
+        def test_tool(self, value: str = spec.Param(description=ref.self.count)) -> str:
+            return value
+
+    validator = _AgentConstructionValidator(TestAgent)
+    with pytest.raises(AgentValidationError, match="description"):
+        validator.validate()
+
+
+def test_validator_skips_sample_agent_without_tools_or_state(monkeypatch):
+    """Test that validate doesn't construct a sample agent when there is nothing to check"""
+
+    class TestAgent(BaseAgent):
+        __system_message__ = "Test"
+
+    calls = []
+    monkeypatch.setattr(TestAgent, "__init__", lambda self, *args, **kwargs: calls.append(1))
+
+    validator = _AgentConstructionValidator(TestAgent)
+    validator.validate()
+    assert calls == []
+    assert "sample_agent" not in validator.__dict__
+
+
+def test_validator_validate_reports_bad_default():
+    """Test that validate reports an explicit default that doesn't match the state type"""
+
+    class TestAgent(BaseAgent):
+        __system_message__ = "Test"
+
+        count: State[int] = spec.State(default=None)
+        other: State[int] = spec.State()
+
+    validator = _AgentConstructionValidator(TestAgent)
+    with pytest.raises(AgentValidationError, match="state.count: Default value") as exc_info:
+        validator.validate()
+    assert "state.other" not in str(exc_info.value)
+
+
+def test_validator_calls_default_factory_once():
+    """Test that validate reuses one factory call for the default check and sample agent"""
+    calls = []
+
+    def make_items() -> list[str]:
+        calls.append(1)
+        return ["a"]
+
+    class TestAgent(BaseAgent):
+        __system_message__ = "Test"
+
+        items: State[list[str]] = spec.State(default_factory=make_items)
+
+    calls.clear()
+    validator = _AgentConstructionValidator(TestAgent)
+    validator.validate()
+    assert validator.problems == []
+    assert len(calls) == 1
+    assert validator.sample_agent.items == ["a"]
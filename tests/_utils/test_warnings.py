@@ -0,0 +1,55 @@
+import inspect
+import warnings
+
+from pyagentic._utils._warnings import deprecated
+
+
+@deprecated("use `new_func` instead", since="0.10", removed="0.12")
+def old_func():
+    return "old"
+
+
+@deprecated("use `NewThing` instead")
+class OldThing:
+    def __init__(self, value):
+        self.value = value
+
+
+def test_deprecated_function_warns_at_call_site():
+    """Test that a deprecated function's warning points at the line that called it"""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        line = inspect.currentframe().f_lineno + 1
+        assert old_func() == "old"
+
+    assert len(caught) == 1
+    assert issubclass(caught[0].category, DeprecationWarning)
+    assert str(caught[0].message) == (
+        "old_func is deprecated since 0.10; use `new_func` instead. It will be removed in 0.12."
+    )
+    assert caught[0].filename == __file__
+    assert caught[0].lineno == line
+
+
+def test_deprecated_class_warns_at_call_site():
+    """Test that instantiating a deprecated class warns at the instantiating line"""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        line = inspect.currentframe().f_lineno + 1
+        thing = OldThing(3)
+
+    assert thing.value == 3
+    assert len(caught) == 1
+    assert str(caught[0].message) == "OldThing is deprecated; use `NewThing` instead."
+    assert caught[0].filename == __file__
+    assert caught[0].lineno == line
+
+
+def test_deprecated_warns_on_every_call():
+    """Test that each use emits a warning, leaving dedup to the warnings filters"""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        old_func()
+        old_func()
+
+    assert len(caught) == 2
@@ -336,3 +336,28 @@ class TestTracedDecorator:
 
         # Inner span should be child of outer span
         assert inner_span.context.parent_span_id == outer_span.context.span_id
+
+
+class TestNoopTracer:
+    """Test suite for the disabled tracer fast path."""
+
+    @pytest.mark.asyncio
+    async def test_noop_span_skips_context(self):
+        """Test that a disabled tracer yields an unrecorded span without making it current."""
+        from pyagentic.tracing import NoopTracer
+
+        tracer = NoopTracer()
+
+        async with tracer.tool("test") as span:
+            assert span.name == "test"
+            assert tracer.current_span is None
+            tracer.set_attributes(key="value")
+            tracer.record_exception("ignored")
+            span.attributes["key"] = "value"
+            span.status = SpanStatus.ERROR
+
+        # Mutating one yielded span must not leak into later ones
+        async with tracer.tool("other") as other:
+            assert other is not span
+            assert other.attributes == {}
+            assert other.status == SpanStatus.OK